@@ -67,52 +67,63 @@ export default function IFRS15AccountingControl() {
         const balances = await reportsService.generateContractBalances(periodEnd);
         // Transform to accounting control format
         const contracts = (balances as any)?.contracts || [];
-      const assets = contracts
-        .filter((c: any) => Number(c.contractAsset || 0) > 0)
-        .map((c: any) => ({
-          id: c.contractId,
-          contractId: c.contractId,
-          contractNumber: c.contractNumber,
-          customerName: c.customerName,
-          openingBalance: 0,
-          debits: Number(c.contractAsset || 0),
-          credits: 0,
-          movement: Number(c.contractAsset || 0),
-          closingBalance: Number(c.contractAsset || 0),
-          currency: "BRL",
-          type: "asset" as const,
-        }));
-      const liabilities = contracts
-        .filter((c: any) => Number(c.contractLiability || 0) > 0)
-        .map((c: any) => ({
-          id: c.contractId,
-          contractId: c.contractId,
-          contractNumber: c.contractNumber,
-          customerName: c.customerName,
-          openingBalance: 0,
-          debits: 0,
-          credits: Number(c.contractLiability || 0),
-          movement: -Number(c.contractLiability || 0),
-          closingBalance: Number(c.contractLiability || 0),
-          currency: "BRL",
-          type: "liability" as const,
-        }));
+      // Build rows and totals in a single pass over the contracts
+      const assets: AccountingControlRow[] = [];
+      const liabilities: AccountingControlRow[] = [];
+      let totalAssets = 0;
+      let totalLiabilities = 0;
+      for (const c of contracts) {
+        const contractAsset = Number(c.contractAsset || 0);
+        const contractLiability = Number(c.contractLiability || 0);
+        if (contractAsset > 0) {
+          assets.push({
+            id: c.contractId,
+            contractId: c.contractId,
+            contractNumber: c.contractNumber,
+            customerName: c.customerName,
+            openingBalance: 0,
+            debits: contractAsset,
+            credits: 0,
+            movement: contractAsset,
+            closingBalance: contractAsset,
+            currency: "BRL",
+            type: "asset",
+          });
+          totalAssets += contractAsset;
+        }
+        if (contractLiability > 0) {
+          liabilities.push({
+            id: c.contractId,
+            contractId: c.contractId,
+            contractNumber: c.contractNumber,
+            customerName: c.customerName,
+            openingBalance: 0,
+            debits: 0,
+            credits: contractLiability,
+            movement: -contractLiability,
+            closingBalance: contractLiability,
+            currency: "BRL",
+            type: "liability",
+          });
+          totalLiabilities += contractLiability;
+        }
+      }
       
       return {
         period: `${selectedYear}-${selectedMonth}`,
         contractAssets: assets,
         contractLiabilities: liabilities,
         totalAssetOpening: 0,
-        totalAssetDebits: assets.reduce((sum: number, a: any) => sum + a.debits, 0),
+        totalAssetDebits: totalAssets,
         totalAssetCredits: 0,
-        totalAssetMovement: assets.reduce((sum: number, a: any) => sum + a.movement, 0),
-        totalAssetClosing: assets.reduce((sum: number, a: any) => sum + a.closingBalance, 0),
+        totalAssetMovement: totalAssets,
+        totalAssetClosing: totalAssets,
         totalLiabilityOpening: 0,
         totalLiabilityDebits: 0,
-        totalLiabilityCredits: liabilities.reduce((sum: number, l: any) => sum + l.credits, 0),
-        totalLiabilityMovement: liabilities.reduce((sum: number, l: any) => sum + l.movement, 0),
-        totalLiabilityClosing: liabilities.reduce((sum: number, l: any) => sum + l.closingBalance, 0),
-      } as any;
+        totalLiabilityCredits: totalLiabilities,
+        totalLiabilityMovement: -totalLiabilities,
+        totalLiabilityClosing: totalLiabilities,
+      };
       } catch (error) {
         console.warn("Failed to load accounting control data:", error);
         return {
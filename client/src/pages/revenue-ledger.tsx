@@ -378,13 +378,14 @@ export default function RevenueLedger() {
     },
   });
 
+  const normalizedSearch = searchQuery.toLowerCase();
   const filteredEntries = entriesWithDetails.filter((entry) => {
     const matchesSearch =
-      entry.contractNumber?.toLowerCase().includes(searchQuery.toLowerCase()) ||
-      entry.customerName?.toLowerCase().includes(searchQuery.toLowerCase()) ||
-      entry.referenceNumber?.toLowerCase().includes(searchQuery.toLowerCase()) ||
-      entry.debitAccount?.toLowerCase().includes(searchQuery.toLowerCase()) ||
-      entry.creditAccount?.toLowerCase().includes(searchQuery.toLowerCase());
+      entry.contractNumber?.toLowerCase().includes(normalizedSearch) ||
+      entry.customerName?.toLowerCase().includes(normalizedSearch) ||
+      entry.referenceNumber?.toLowerCase().includes(normalizedSearch) ||
+      entry.debitAccount?.toLowerCase().includes(normalizedSearch) ||
+      entry.creditAccount?.toLowerCase().includes(normalizedSearch);
     const matchesType = typeFilter === "all" || entry.entryType === typeFilter;
     const matchesPosted = 
       postedFilter === "all" || 